@@ -600,12 +600,13 @@ export class AudioTranscriptionApp {
   private updateNotesDisplay(): void {
     if (!this.elements.notesContainer) return;
 
-    this.elements.notesContainer.innerHTML = '';
-    
+    // Build the list off-DOM so the container is re-laid out once
+    const fragment = document.createDocumentFragment();
     this.state.notes.forEach(note => {
-      const noteElement = this.createNoteElement(note);
-      this.elements.notesContainer!.appendChild(noteElement);
+      fragment.appendChild(this.createNoteElement(note));
     });
+
+    this.elements.notesContainer.replaceChildren(fragment);
   }
 
   private createNoteElement(note: any): HTMLElement {
@@ -13,6 +13,7 @@ export const APP_CONFIG = {
     BORDER_WIDTH: 1,
     PADDING: 10,
     ANIMATION_DURATION: 750,
+    MAX_LINE_POINTS: 500,             // Longer series are LTTB-downsampled
   },
   
   // Timing and intervals (in milliseconds)
@@ -3,43 +3,16 @@
  * SPDX-License-Identifier: Apache-2.0
  */
 
-import {
-  Chart,
-  LineController,
-  LineElement,
-  PointElement,
-  LinearScale,
-  CategoryScale,
-  BarController,
-  BarElement,
-  PieController,
-  ArcElement,
-  Legend,
-  Tooltip,
-  Title,
-} from 'chart.js';
+import type { Chart } from 'chart.js';
 import { ChartConfig } from '../types/index.js';
-import { COLORS } from '../constants.js';
+import { APP_CONFIG, COLORS } from '../constants.js';
 import { ErrorHandler } from '../utils.js';
 
-// Register Chart.js components
-Chart.register(
-  LineController,
-  LineElement,
-  PointElement,
-  LinearScale,
-  CategoryScale,
-  BarController,
-  BarElement,
-  PieController,
-  ArcElement,
-  Legend,
-  Tooltip,
-  Title
-);
-
 export class ChartManager {
+  private static chartJsLoader: Promise<typeof import('chart.js')> | null = null;
   private charts: Map<string, Chart> = new Map();
+  // Serialized config each chart was built from, to skip identical rebuilds
+  private chartKeys: Map<string, string> = new Map();
   private readonly defaultOptions = {
     responsive: true,
     maintainAspectRatio: false,
@@ -53,12 +26,55 @@ export class ChartManager {
     },
   };
 
-  public createChart(canvasId: string, config: ChartConfig): Chart | null {
+  /**
+   * Load Chart.js on first use and register the components we draw with,
+   * keeping it off the startup path
+   */
+  private static loadChartJs(): Promise<typeof import('chart.js')> {
+    if (!ChartManager.chartJsLoader) {
+      ChartManager.chartJsLoader = import('chart.js')
+        .then(chartJs => {
+          chartJs.Chart.register(
+            chartJs.LineController,
+            chartJs.LineElement,
+            chartJs.PointElement,
+            chartJs.LinearScale,
+            chartJs.CategoryScale,
+            chartJs.BarController,
+            chartJs.BarElement,
+            chartJs.PieController,
+            chartJs.ArcElement,
+            chartJs.Legend,
+            chartJs.Tooltip,
+            chartJs.Title
+          );
+          return chartJs;
+        })
+        .catch(error => {
+          // Allow a later call to retry the import
+          ChartManager.chartJsLoader = null;
+          throw error;
+        });
+    }
+    return ChartManager.chartJsLoader;
+  }
+
+  public async createChart(canvasId: string, config: ChartConfig): Promise<Chart | null> {
     try {
+      const { Chart } = await ChartManager.loadChartJs();
+
+      const canvas = document.getElementById(canvasId) as HTMLCanvasElement;
+      const chartKey = JSON.stringify(config);
+      const existing = this.charts.get(canvasId);
+
+      // Same config on the same canvas: keep the rendered chart
+      if (existing && existing.canvas === canvas && this.chartKeys.get(canvasId) === chartKey) {
+        return existing;
+      }
+
       // Destroy existing chart if it exists
       this.destroyChart(canvasId);
 
-      const canvas = document.getElementById(canvasId) as HTMLCanvasElement;
       if (!canvas) {
         throw new Error(`Canvas element with id '${canvasId}' not found`);
       }
@@ -79,6 +95,7 @@ export class ChartManager {
 
       const chart = new Chart(ctx, chartConfig);
       this.charts.set(canvasId, chart);
+      this.chartKeys.set(canvasId, chartKey);
       
       return chart;
     } catch (error) {
@@ -87,7 +104,7 @@ export class ChartManager {
     }
   }
 
-  public createTopicChart(canvasId: string, data: any, title: string = 'Topic Distribution'): Chart | null {
+  public createTopicChart(canvasId: string, data: any, title: string = 'Topic Distribution'): Promise<Chart | null> {
     const config: ChartConfig = {
       type: 'pie',
       data: {
@@ -116,7 +133,7 @@ export class ChartManager {
     return this.createChart(canvasId, config);
   }
 
-  public createSentimentChart(canvasId: string, data: any, title: string = 'Sentiment Analysis'): Chart | null {
+  public createSentimentChart(canvasId: string, data: any, title: string = 'Sentiment Analysis'): Promise<Chart | null> {
     const config: ChartConfig = {
       type: 'doughnut',
       data: {
@@ -146,7 +163,7 @@ export class ChartManager {
     return this.createChart(canvasId, config);
   }
 
-  public createWordFrequencyChart(canvasId: string, data: any, title: string = 'Word Frequency'): Chart | null {
+  public createWordFrequencyChart(canvasId: string, data: any, title: string = 'Word Frequency'): Promise<Chart | null> {
     const config: ChartConfig = {
       type: 'bar',
       data: {
@@ -191,14 +208,20 @@ export class ChartManager {
     return this.createChart(canvasId, config);
   }
 
-  public createLineChart(canvasId: string, data: any, title: string = 'Line Chart'): Chart | null {
+  public createLineChart(canvasId: string, data: any, title: string = 'Line Chart'): Promise<Chart | null> {
+    const { labels, values } = ChartManager.downsampleLTTB(
+      data.labels || [],
+      data.data || [],
+      APP_CONFIG.CHART.MAX_LINE_POINTS
+    );
+
     const config: ChartConfig = {
       type: 'line',
       data: {
-        labels: data.labels || [],
+        labels,
         datasets: [{
           label: data.label || 'Data',
-          data: data.data || [],
+          data: values,
           borderColor: COLORS.primary,
           backgroundColor: COLORS.primaryLight,
           borderWidth: 2,
@@ -224,11 +247,74 @@ export class ChartManager {
     return this.createChart(canvasId, config);
   }
 
+  /**
+   * Largest-Triangle-Three-Buckets downsampling. Keeps the first and last
+   * points and, per bucket, the point forming the largest triangle with its
+   * neighbours, so peaks survive while the point count drops to `threshold`.
+   */
+  private static downsampleLTTB(
+    labels: string[],
+    values: number[],
+    threshold: number
+  ): { labels: string[]; values: number[] } {
+    const length = values.length;
+    if (threshold < 3 || length <= threshold) {
+      return { labels, values };
+    }
+
+    const sampledLabels: string[] = [labels[0]];
+    const sampledValues: number[] = [values[0]];
+    const bucketSize = (length - 2) / (threshold - 2);
+    let selected = 0;
+
+    for (let bucket = 0; bucket < threshold - 2; bucket++) {
+      // Average of the next bucket is the third triangle vertex
+      const nextStart = Math.floor((bucket + 1) * bucketSize) + 1;
+      const nextEnd = Math.min(Math.floor((bucket + 2) * bucketSize) + 1, length);
+      let avgX = 0;
+      let avgY = 0;
+      for (let i = nextStart; i < nextEnd; i++) {
+        avgX += i;
+        avgY += values[i];
+      }
+      const nextCount = nextEnd - nextStart;
+      avgX /= nextCount;
+      avgY /= nextCount;
+
+      const start = Math.floor(bucket * bucketSize) + 1;
+      const end = Math.floor((bucket + 1) * bucketSize) + 1;
+      const selectedY = values[selected];
+      let maxArea = -1;
+      let candidate = start;
+
+      for (let i = start; i < end; i++) {
+        const area = Math.abs(
+          (selected - avgX) * (values[i] - selectedY) -
+          (selected - i) * (avgY - selectedY)
+        );
+        if (area > maxArea) {
+          maxArea = area;
+          candidate = i;
+        }
+      }
+
+      sampledLabels.push(labels[candidate]);
+      sampledValues.push(values[candidate]);
+      selected = candidate;
+    }
+
+    sampledLabels.push(labels[length - 1]);
+    sampledValues.push(values[length - 1]);
+
+    return { labels: sampledLabels, values: sampledValues };
+  }
+
   public destroyChart(canvasId: string): void {
     const chart = this.charts.get(canvasId);
     if (chart) {
       chart.destroy();
       this.charts.delete(canvasId);
+      this.chartKeys.delete(canvasId);
     }
   }
 
@@ -237,6 +323,7 @@ export class ChartManager {
       chart.destroy();
     });
     this.charts.clear();
+    this.chartKeys.clear();
   }
 
   public getChart(canvasId: string): Chart | undefined {
@@ -252,6 +339,7 @@ export class ChartManager {
 
       chart.data = newData;
       chart.update();
+      this.chartKeys.delete(canvasId);
       return true;
     } catch (error) {
       ErrorHandler.logError(`Failed to update chart: ${canvasId}`, error);
@@ -8,6 +8,19 @@ import { ErrorHandler } from '../utils.js';
 
 export class DataProcessor {
   private static readonly STORAGE_KEY = 'voiceNotesData';
+  // Last raw payload read from storage and its parsed form, so repeated
+  // reads of unchanged data skip JSON.parse
+  private static cachedRaw: string | null = null;
+  private static cachedNotes: StoredNote[] = [];
+
+  private static readonly EXPORT_HTML_STYLES = `<style>
+        body { font-family: Arial, sans-serif; max-width: 800px; margin: 0 auto; padding: 20px; }
+        .note { margin-bottom: 30px; padding: 20px; border: 1px solid #ddd; border-radius: 8px; }
+        .note h2 { color: #333; margin-top: 0; }
+        .content { margin: 15px 0; line-height: 1.6; }
+        .raw-transcription { margin-top: 20px; padding: 15px; background-color: #f5f5f5; border-radius: 4px; }
+        .raw-transcription h3 { margin-top: 0; color: #666; }
+    </style>`;
 
   public static saveNote(note: Note): void {
     try {
@@ -35,7 +48,15 @@ export class DataProcessor {
   public static getAllNotes(): StoredNote[] {
     try {
       const stored = localStorage.getItem(this.STORAGE_KEY);
-      return stored ? JSON.parse(stored) : [];
+      if (!stored) return [];
+
+      if (stored !== this.cachedRaw) {
+        this.cachedNotes = JSON.parse(stored);
+        this.cachedRaw = stored;
+      }
+
+      // Callers mutate the returned array before writing it back
+      return [...this.cachedNotes];
     } catch (error) {
       ErrorHandler.logError('Failed to load notes', error);
       return [];
@@ -146,16 +167,22 @@ export class DataProcessor {
   }
 
   private static exportAsMarkdown(notes: StoredNote[], includeRaw: boolean): string {
-    return notes.map(note => {
+    const sections: string[] = [];
+
+    for (const note of notes) {
       const date = new Date(note.timestamp).toLocaleDateString();
-      let content = `# ${note.title}\n\n**Date:** ${date}\n\n${note.polishedNote}\n\n`;
-      
+      sections.push(`# ${note.title}`, `**Date:** ${date}`, note.polishedNote);
+
       if (includeRaw && note.rawTranscription !== note.polishedNote) {
-        content += `## Raw Transcription\n\n${note.rawTranscription}\n\n`;
+        sections.push('## Raw Transcription', note.rawTranscription);
       }
-      
-      return content;
-    }).join('---\n\n');
+
+      sections.push('---');
+    }
+
+    // Drop the trailing separator; every section is followed by a blank line
+    sections.pop();
+    return sections.length > 0 ? `${sections.join('\n\n')}\n\n` : '';
   }
 
   private static exportAsPlainText(notes: StoredNote[], includeRaw: boolean): string {
@@ -201,14 +228,7 @@ export class DataProcessor {
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Voice Notes Export</title>
-    <style>
-        body { font-family: Arial, sans-serif; max-width: 800px; margin: 0 auto; padding: 20px; }
-        .note { margin-bottom: 30px; padding: 20px; border: 1px solid #ddd; border-radius: 8px; }
-        .note h2 { color: #333; margin-top: 0; }
-        .content { margin: 15px 0; line-height: 1.6; }
-        .raw-transcription { margin-top: 20px; padding: 15px; background-color: #f5f5f5; border-radius: 4px; }
-        .raw-transcription h3 { margin-top: 0; color: #666; }
-    </style>
+    ${this.EXPORT_HTML_STYLES}
 </head>
 <body>
     <h1>Voice Notes Export</h1>
@@ -262,21 +282,26 @@ export class DataProcessor {
         };
       }
 
-      const totalWords = notes.reduce((sum, note) => {
-        const wordCount = note.polishedNote.trim().split(/\s+/).length;
-        return sum + wordCount;
-      }, 0);
+      // Single pass over the notes, reading each field once
+      let totalWords = 0;
+      let totalCharacters = 0;
+      let oldest = Infinity;
+      let newest = -Infinity;
 
-      const totalCharacters = notes.reduce((sum, note) => sum + note.polishedNote.length, 0);
-      const timestamps = notes.map(note => note.timestamp);
+      for (const { polishedNote, timestamp } of notes) {
+        totalWords += polishedNote.trim().split(/\s+/).length;
+        totalCharacters += polishedNote.length;
+        oldest = Math.min(oldest, timestamp);
+        newest = Math.max(newest, timestamp);
+      }
 
       return {
         totalNotes: notes.length,
         totalWords,
         totalCharacters,
         averageWordsPerNote: Math.round(totalWords / notes.length),
-        oldestNote: new Date(Math.min(...timestamps)),
-        newestNote: new Date(Math.max(...timestamps)),
+        oldestNote: new Date(oldest),
+        newestNote: new Date(newest),
       };
     } catch (error) {
       ErrorHandler.logError('Failed to get notes stats', error);
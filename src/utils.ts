@@ -230,6 +230,14 @@ export class ErrorHandler {
   private static instance: ErrorHandler;
   private logger = LoggerService.getInstance();
   private retryAttempts = new Map<string, number>();
+  private static readonly NETWORK_ERROR_PATTERNS: readonly string[] = [
+    'network',
+    'timeout',
+    'fetch',
+    'connection',
+    'cors',
+    'offline'
+  ];
 
   private constructor() {}
 
@@ -309,17 +317,8 @@ export class ErrorHandler {
   }
 
   public isNetworkError(error: Error): boolean {
-    const networkErrorPatterns = [
-      'network',
-      'timeout',
-      'fetch',
-      'connection',
-      'cors',
-      'offline'
-    ];
-    
     const message = error.message.toLowerCase();
-    return networkErrorPatterns.some(pattern => message.includes(pattern));
+    return ErrorHandler.NETWORK_ERROR_PATTERNS.some(pattern => message.includes(pattern));
   }
 
   public getRetryCount(operationName: string): number {